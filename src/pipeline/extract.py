@@ -1,31 +1,150 @@
 # src/pipeline/extract.py
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import pandas as pd
-import yaml
+from src.utils.config import load_config
 from src.utils.logger import get_logger
 
 
 logger = get_logger(__name__)
 
+# Columns the pipeline uses from each CSV. Extract reads only these, and
+# validate checks that all of them are present.
+LISTINGS_COLUMNS = (
+    "id",
+    "name",
+    "host_id",
+    "host_name",
+    "neighbourhood_group",
+    "neighbourhood",
+    "latitude",
+    "longitude",
+    "room_type",
+    "price",
+    "minimum_nights",
+    "number_of_reviews",
+    "last_review",
+    "reviews_per_month",
+    "calculated_host_listings_count",
+    "availability_365",
+    "number_of_reviews_ltm",
+    "license",
+)
+REVIEWS_COLUMNS = ("listing_id", "date")
 
-def run_extract(config_path: str = "src/config/config.yaml"):
+# Listing ids use all 64 bits; a single null must not turn the column into
+# float64, which would round every large id (nullable Int64 keeps them exact)
+_REVIEWS_DTYPES = {"listing_id": "Int64"}
+
+# Dtypes applied at read time, so later steps don't re-coerce the columns.
+# Coordinates and reviews_per_month keep float64: they land in NUMERIC columns
+# and float32 would add spurious decimals.
+_LISTINGS_DTYPES = {
+    "minimum_nights": "float32",
+    "number_of_reviews": "float32",
+    "reviews_per_month": "float64",
+    "number_of_reviews_ltm": "float32",
+    "availability_365": "float32",
+    "latitude": "float64",
+    "longitude": "float64",
+    # Low-cardinality text: dedup and the neighbourhood merge run on int codes
+    "neighbourhood_group": "category",
+    "neighbourhood": "category",
+    "room_type": "category",
+}
+
+
+def _read_listings(path: Path) -> pd.DataFrame:
+    """Read the used listings columns with the PyArrow engine and set dtypes."""
+    return pd.read_csv(
+        path,
+        engine="pyarrow",
+        usecols=list(LISTINGS_COLUMNS),
+        dtype=_LISTINGS_DTYPES,
+    )
+
+
+def run_extract(
+    config_path: str = "src/config/config.yaml",
+    reviews_chunksize: int | None = None,
+):
     """
     Extract step:
     - Read listings.csv and reviews.csv from paths in config.
+    - Only the columns used downstream are read, with the PyArrow engine.
+    - Both files are read concurrently.
+    - Listings numeric columns are parsed to their dtypes at read time.
     - Return raw Pandas DataFrames.
+
+    If reviews_chunksize is set, reviews is returned as a lazy TextFileReader
+    yielding DataFrames of at most that many rows instead of a single frame.
     """
-    with open(config_path) as f:
-        config = yaml.safe_load(f)
+    config = load_config(config_path)
 
     listings_path = Path(config["data_paths"]["listings"])
     reviews_path = Path(config["data_paths"]["reviews"])
 
-    logger.info(f"Extracting listings from {listings_path}")
-    logger.info(f"Extracting reviews from {reviews_path}")
+    logger.info("Extracting listings from %s", listings_path)
+    logger.info("Extracting reviews from %s", reviews_path)
+
+    if reviews_chunksize:
+        # The PyArrow engine can't chunk; the C engine parses lazily per chunk
+        listings = _read_listings(listings_path)
+        reviews = pd.read_csv(
+            reviews_path,
+            usecols=list(REVIEWS_COLUMNS),
+            dtype=_REVIEWS_DTYPES,
+            chunksize=reviews_chunksize,
+        )
+        logger.info(
+            "Listings rows: %d, Reviews streamed in chunks of %d",
+            len(listings),
+            reviews_chunksize,
+        )
+        return listings, reviews
 
-    listings = pd.read_csv(listings_path)
-    reviews = pd.read_csv(reviews_path)
+    # The two files are independent; read them concurrently (the parser
+    # releases the GIL, so the reads overlap).
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        listings_future = executor.submit(_read_listings, listings_path)
+        reviews_future = executor.submit(
+            pd.read_csv,
+            reviews_path,
+            engine="pyarrow",
+            usecols=list(REVIEWS_COLUMNS),
+            parse_dates=["date"],
+            # The PyArrow engine goes through float64 for a dtype= mapping;
+            # nullable dtypes come straight from the Arrow int64 column
+            dtype_backend="numpy_nullable",
+        )
+        listings = listings_future.result()
+        reviews = reviews_future.result()
 
-    logger.info(f"Listings rows: {len(listings)}, Reviews rows: {len(reviews)}")
+    logger.info("Listings rows: %d, Reviews rows: %d", len(listings), len(reviews))
     return listings, reviews
-    
\ No newline at end of file
+
+
+def scan_review_dates(config_path: str, chunksize: int, listing_ids):
+    """
+    Return the (first, last) date of reviews whose listing_id is in
+    listing_ids (the validated listings), scanning reviews.csv chunk by chunk
+    so memory stays bounded. Null-id and orphan reviews are skipped, so the
+    span matches the one the whole-frame path takes from validated reviews.
+    """
+    config = load_config(config_path)
+    reviews_path = Path(config["data_paths"]["reviews"])
+    valid_ids = pd.Index(listing_ids)
+
+    firsts, lasts = [], []
+    for chunk in pd.read_csv(
+        reviews_path,
+        usecols=list(REVIEWS_COLUMNS),
+        dtype=_REVIEWS_DTYPES,
+        chunksize=chunksize,
+    ):
+        chunk = chunk[chunk["listing_id"].isin(valid_ids)]
+        dates = pd.to_datetime(chunk["date"], errors="coerce")
+        firsts.append(dates.min())
+        lasts.append(dates.max())
+
+    return pd.Series(firsts).min(), pd.Series(lasts).max()
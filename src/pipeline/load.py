@@ -1,39 +1,135 @@
 # src/pipeline/load.py
-import yaml
+import io
+import pandas as pd
 from sqlalchemy import text
+from src.utils.config import load_config
+from src.pipeline.transform import DWTables, build_fact_reviews
+from src.pipeline.validate import StreamedReviewStats
 from src.utils.db_connector import get_engine
 from src.utils.logger import get_logger
 
 
 logger = get_logger(__name__)
 
+# Bind parameters allowed in a single statement, per dialect. SQLite's
+# default is 32766 (SQLITE_MAX_VARIABLE_NUMBER since 3.32); unknown dialects
+# get the same conservative cap.
+_MAX_INSERT_PARAMS = {"postgresql": 65_535, "sqlite": 32_766}
+_DEFAULT_MAX_INSERT_PARAMS = 32_766
+
+
+def _insert_df(conn, table: str, df):
+    """Fallback bulk insert: multi-row INSERT statements via to_sql."""
+    max_params = _MAX_INSERT_PARAMS.get(
+        conn.dialect.name, _DEFAULT_MAX_INSERT_PARAMS
+    )
+    chunksize = min(10_000, max_params // max(len(df.columns), 1))
+    df.to_sql(
+        table,
+        conn,
+        if_exists="append",
+        index=False,
+        method="multi",
+        chunksize=chunksize,
+    )
+
+
+def _copy_df(conn, table: str, df):
+    """
+    Bulk-load a DataFrame into `table` with Postgres COPY FROM STDIN.
+    Runs on the DBAPI connection behind `conn`, so it shares its transaction.
+    Drivers other than psycopg2 have no copy_expert; they use _insert_df.
+    """
+    if conn.dialect.driver != "psycopg2":
+        _insert_df(conn, table, df)
+        return
+
+    buf = io.StringIO()
+    df.to_csv(buf, index=False, header=False, na_rep="\\N")
+    buf.seek(0)
+
+    columns = ", ".join(df.columns)
+    cursor = conn.connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {table} ({columns}) FROM STDIN WITH (FORMAT CSV, NULL '\\N')",
+            buf,
+        )
+    finally:
+        cursor.close()
+
+
+def stream_reviews_to_facts(
+    dim_listing: pd.DataFrame,
+    dim_host: pd.DataFrame,
+    dim_date: pd.DataFrame,
+    reviews_iter,
+    conn,
+    table: str = "fact_reviews",
+) -> StreamedReviewStats:
+    """
+    Resolve and COPY fact rows one reviews chunk at a time, so only a single
+    chunk is held in memory. Reviews with a null/unknown listing_id or an
+    unparseable date are dropped. Returns the row, null-id, orphan and loaded
+    counts for the data quality report.
+    """
+    # Built once; each chunk's FK check probes this hashtable
+    listing_ids = pd.Index(dim_listing["listing_id"])
+    stats = None
+    for chunk in reviews_iter:
+        if stats is None:
+            stats = StreamedReviewStats(columns=list(chunk.columns))
+        null_ids = chunk["listing_id"].isna().to_numpy()
+        chunk = chunk[~null_ids]
+        orphans = int((~chunk["listing_id"].isin(listing_ids)).to_numpy().sum())
+        chunk = chunk.assign(
+            date=lambda df: pd.to_datetime(df["date"], errors="coerce")
+        )
+
+        fact_chunk = build_fact_reviews(chunk, dim_listing, dim_host, dim_date)
+        _copy_df(conn, table, fact_chunk)
+
+        stats.row_count += len(null_ids)
+        stats.null_listing_ids += int(null_ids.sum())
+        stats.orphan_reviews += orphans
+        stats.loaded += len(fact_chunk)
+
+    if stats is None:
+        return StreamedReviewStats(columns=[])
+
+    # Reviews of a known listing whose host or date didn't resolve
+    other_dropped = (
+        stats.row_count - stats.null_listing_ids - stats.orphan_reviews - stats.loaded
+    )
+    if other_dropped > 0:
+        logger.warning(
+            "Dropped %d streamed reviews with an unknown host or date", other_dropped
+        )
+    return stats
+
 
 def run_load(
-    dims: dict,
-    facts: dict,
+    tables: DWTables,
     config_path: str = "src/config/config.yaml",
+    reviews_iter=None,
 ):
     """
     Load step:
     - Idempotent: truncate all DW tables and full-refresh load.
-    - Load dimensions first, then fact table.
+    - Load dimensions first, then fact table, using COPY for bulk inserts.
     - Uses surrogate keys generated in transform.
+    - If reviews_iter (an iterator of raw review chunks) is given,
+      fact_reviews is streamed chunk by chunk instead of taken from tables,
+      and the StreamedReviewStats of the stream are returned (else None).
     """
     logger.info("Starting load step")
 
-    with open(config_path) as f:
-        config = yaml.safe_load(f)
+    config = load_config(config_path)
 
     tables_cfg = config["tables"]
 
     engine = get_engine()
 
-    dim_date_df = dims["dim_date"]
-    dim_neighborhood_df = dims["dim_neighborhood"]
-    dim_host_df = dims["dim_host"]
-    dim_listing_df = dims["dim_listing"]
-    fact_reviews_df = facts["fact_reviews"]
-
     with engine.begin() as conn:
         logger.info("Truncating DW tables for full-refresh (idempotent load)")
         conn.execute(
@@ -57,43 +153,31 @@ def run_load(
         )
 
         logger.info("Loading dim_date")
-        dim_date_df.to_sql(
-            tables_cfg["dim_date"],
-            conn,
-            if_exists="append",
-            index=False,
-        )
+        _copy_df(conn, tables_cfg["dim_date"], tables.dim_date)
 
         logger.info("Loading dim_neighborhood")
-        dim_neighborhood_df.to_sql(
-            tables_cfg["dim_neighborhood"],
-            conn,
-            if_exists="append",
-            index=False,
-        )
+        _copy_df(conn, tables_cfg["dim_neighborhood"], tables.dim_neighborhood)
 
         logger.info("Loading dim_host (SCD2-ready structure, single snapshot)")
-        dim_host_df.to_sql(
-            tables_cfg["dim_host"],
-            conn,
-            if_exists="append",
-            index=False,
-        )
+        _copy_df(conn, tables_cfg["dim_host"], tables.dim_host)
 
         logger.info("Loading dim_listing")
-        dim_listing_df.to_sql(
-            tables_cfg["dim_listing"],
-            conn,
-            if_exists="append",
-            index=False,
-        )
+        _copy_df(conn, tables_cfg["dim_listing"], tables.dim_listing)
 
         logger.info("Loading fact_reviews")
-        fact_reviews_df.to_sql(
-            tables_cfg["fact_reviews"],
-            conn,
-            if_exists="append",
-            index=False,
-        )
+        if reviews_iter is not None:
+            review_stats = stream_reviews_to_facts(
+                tables.dim_listing,
+                tables.dim_host,
+                tables.dim_date,
+                reviews_iter,
+                conn,
+                tables_cfg["fact_reviews"],
+            )
+            logger.info("Streamed %d fact_reviews rows", review_stats.loaded)
+        else:
+            review_stats = None
+            _copy_df(conn, tables_cfg["fact_reviews"], tables.fact_reviews)
 
     logger.info("Load step complete")
+    return review_stats
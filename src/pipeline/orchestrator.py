@@ -1,17 +1,55 @@
 # src/pipeline/orchestrator.py
-from src.pipeline.extract import run_extract
-from src.pipeline.validate import run_validate
-from src.pipeline.transform import run_transform
+import pandas as pd
+from src.pipeline.extract import run_extract, scan_review_dates
+from src.pipeline.validate import record_streamed_review_checks, run_validate
+from src.pipeline.transform import build_dims, run_transform
 from src.pipeline.load import run_load
+from src.utils.config import load_config
 from src.utils.logger import get_logger
 
 
 logger = get_logger(__name__)
 
 
+def _run_streaming(config_path: str, reviews_chunksize: int):
+    """
+    Same steps as run_pipeline, but reviews.csv is never held in memory as a
+    whole: dims are built from listings plus the review date span, then
+    fact_reviews is resolved and COPY'd one chunk at a time.
+    """
+    # 1) Extract (reviews as a lazy chunk reader)
+    listings, reviews_iter = run_extract(
+        config_path=config_path, reviews_chunksize=reviews_chunksize
+    )
+
+    # 2) Validate listings; orphan reviews are dropped per chunk during load
+    listings, _ = run_validate(listings, None, config_path=config_path)
+
+    # 3) Transform dimensions; the calendar spans reviews of valid listings only
+    first_date, last_date = scan_review_dates(
+        config_path, reviews_chunksize, listings["id"]
+    )
+    tables = build_dims(listings, first_date, last_date)
+
+    # 4) Load dims, then stream facts
+    review_stats = run_load(
+        tables, config_path=config_path, reviews_iter=reviews_iter
+    )
+
+    # 5) Complete the data quality report with the streamed review checks
+    record_streamed_review_checks(review_stats, config_path=config_path)
+
+
 def run_pipeline(config_path: str = "src/config/config.yaml"):
     logger.info("=== Airbnb DW Pipeline START ===")
 
+    config = load_config(config_path)
+    reviews_chunksize = config.get("pipeline", {}).get("reviews_chunksize")
+    if reviews_chunksize:
+        _run_streaming(config_path, reviews_chunksize)
+        logger.info("=== Airbnb DW Pipeline END ===")
+        return
+
     # 1) Extract
     listings, reviews = run_extract(config_path=config_path)
 
@@ -21,13 +59,16 @@ def run_pipeline(config_path: str = "src/config/config.yaml"):
     )
 
     # 3) Transform
-    dims, facts = run_transform(listings, reviews)
+    tables = run_transform(listings, reviews)
 
     # 4) Load
-    run_load(dims, facts, config_path=config_path)
+    run_load(tables, config_path=config_path)
 
     logger.info("=== Airbnb DW Pipeline END ===")
 
 
 if __name__ == "__main__":
+    # Steps hand frames to each other without defensive copies; copy-on-write
+    # makes any derived frame a lazy copy that is only materialised on write.
+    pd.set_option("mode.copy_on_write", True)
     run_pipeline()
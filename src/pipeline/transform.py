@@ -1,94 +1,107 @@
 # src/pipeline/transform.py
+from dataclasses import dataclass
+import numpy as np
 import pandas as pd
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+@dataclass
+class DWTables:
+    """
+    Star-schema tables produced by transform, each already in its warehouse
+    column order so load can COPY them as-is. fact_reviews is None when
+    reviews are streamed to the fact table in chunks.
+    """
+
+    dim_date: pd.DataFrame
+    dim_neighborhood: pd.DataFrame
+    dim_host: pd.DataFrame
+    dim_listing: pd.DataFrame
+    fact_reviews: pd.DataFrame | None = None
+
+
 def clean_price(series: pd.Series) -> pd.Series:
     """Remove currency symbols/commas and convert to float."""
-    return (
-        series.astype(str)
-        .str.replace(r"[^0-9.]", "", regex=True)
-        .replace("", "0")
-        .astype(float)
-    )
-
+    if pd.api.types.is_numeric_dtype(series):
+        # Already parsed by the CSV reader; nothing to strip
+        return series.astype("float64").fillna(0.0)
 
-def classify_price_tier(price: pd.Series) -> pd.Series:
-    """Simple price banding: budget / mid / premium."""
-    return pd.cut(
-        price,
-        bins=[-1, 50, 150, float("inf")],
-        labels=["budget", "mid", "premium"],
+    cleaned = (
+        series.astype("string[pyarrow]")
+        .str.replace("$", "", regex=False)
+        .str.replace(",", "", regex=False)
     )
+    return pd.to_numeric(cleaned, errors="coerce").fillna(0.0).astype("float64")
 
 
-def run_transform(
-    listings: pd.DataFrame,
-    reviews: pd.DataFrame,
-):
+def build_dim_date(first_date, last_date) -> pd.DataFrame:
     """
-    Transform step:
-    - Clean fields
-    - Feature engineering
-    - Build star-schema tables as DataFrames:
-      dim_date, dim_neighborhood, dim_host (SCD2-ready), dim_listing, fact_reviews
+    One row per calendar day from first_date to last_date. date_sk is the day
+    offset from first_date + 1, so facts can derive it without a lookup.
+    If either bound is missing (no parseable review dates), the calendar is
+    empty but keeps the same columns and dtypes.
     """
-    logger.info("Starting transform step")
+    if pd.isna(first_date) or pd.isna(last_date):
+        calendar = pd.DatetimeIndex([], dtype="datetime64[ns]")
+    else:
+        calendar = pd.date_range(first_date.normalize(), last_date, freq="D")
+    return pd.DataFrame(
+        {
+            "date_sk": np.arange(1, len(calendar) + 1, dtype="int32"),
+            "full_date": calendar,
+            "year": calendar.year.astype("int16"),
+            "month": calendar.month.astype("int8"),
+            "day": calendar.day.astype("int8"),
+            "month_name": calendar.month_name(),
+            "day_of_week": (calendar.weekday + 1).astype("int8"),  # 1=Mon
+            "day_name": calendar.day_name(),
+        }
+    )
 
-    listings = listings.copy()
-    reviews = reviews.copy()
 
+def build_dims(listings: pd.DataFrame, first_date, last_date) -> DWTables:
+    """
+    Clean listings and build the dimension tables:
+    dim_date (first_date..last_date), dim_neighborhood, dim_host, dim_listing.
+    The returned DWTables has no fact_reviews yet.
+    The caller's frame is not modified.
+    """
     # --- Basic renaming ---
-    listings.rename(columns={"id": "listing_id"}, inplace=True)
+    # Returns a new frame (lazily copied under copy-on-write), so the column
+    # assignments below never touch the caller's listings.
+    listings = listings.rename(columns={"id": "listing_id"})
+
+    # Natural keys as contiguous int64 so lookups hash fixed-width buffers
+    listings["listing_id"] = listings["listing_id"].astype("int64")
+    listings["host_id"] = listings["host_id"].astype("int64")
 
     # --- Clean prices & numeric fields ---
     listings["price"] = clean_price(listings["price"])
-    listings["minimum_nights"] = pd.to_numeric(
-        listings["minimum_nights"], errors="coerce"
-    ).fillna(0)
-    listings["number_of_reviews"] = pd.to_numeric(
-        listings["number_of_reviews"], errors="coerce"
-    ).fillna(0)
-    listings["reviews_per_month"] = pd.to_numeric(
-        listings["reviews_per_month"], errors="coerce"
-    ).fillna(0)
-    listings["number_of_reviews_ltm"] = pd.to_numeric(
-        listings["number_of_reviews_ltm"], errors="coerce"
-    ).fillna(0)
-
-    # --- Dates ---
-    reviews["date"] = pd.to_datetime(reviews["date"], errors="coerce")
-
-    # --- Feature engineering ---
-    # Simple occupancy proxy using reviews_per_month (totally configurable)
-    listings["estimated_occupancy_rate"] = (
-        listings["reviews_per_month"] / 5
-    ).clip(lower=0, upper=1)
-
-    listings["estimated_monthly_revenue"] = (
-        listings["price"] * listings["estimated_occupancy_rate"] * 30
-    )
-
-    listings["price_tier"] = classify_price_tier(listings["price"])
+    # Numeric dtypes are set at extract time; only missing values need filling
+    num_cols = [
+        "minimum_nights",
+        "number_of_reviews",
+        "reviews_per_month",
+        "number_of_reviews_ltm",
+    ]
+    listings[num_cols] = listings[num_cols].fillna(0)
+    # Whole-number fields load into INT columns, which COPY parses strictly
+    int_cols = [
+        "minimum_nights",
+        "number_of_reviews",
+        "number_of_reviews_ltm",
+        "availability_365",
+    ]
+    listings[int_cols] = listings[int_cols].astype("int64")
+    # Nullable Int64 so a missing count stays NULL instead of becoming "3.0"
+    listings["calculated_host_listings_count"] = listings[
+        "calculated_host_listings_count"
+    ].astype("Int64")
 
     # --- dim_date ---
-    dim_date = (
-        reviews[["date"]]
-        .dropna()
-        .drop_duplicates()
-        .rename(columns={"date": "full_date"})
-        .sort_values("full_date")
-        .reset_index(drop=True)
-    )
-    dim_date["date_sk"] = dim_date.index + 1
-    dim_date["year"] = dim_date["full_date"].dt.year
-    dim_date["month"] = dim_date["full_date"].dt.month
-    dim_date["day"] = dim_date["full_date"].dt.day
-    dim_date["month_name"] = dim_date["full_date"].dt.month_name()
-    dim_date["day_of_week"] = dim_date["full_date"].dt.weekday + 1  # 1=Mon
-    dim_date["day_name"] = dim_date["full_date"].dt.day_name()
+    dim_date = build_dim_date(first_date, last_date)
 
     # --- dim_neighborhood ---
     dim_neighborhood = (
@@ -96,7 +109,9 @@ def run_transform(
         .drop_duplicates()
         .reset_index(drop=True)
     )
-    dim_neighborhood["neighborhood_sk"] = dim_neighborhood.index + 1
+    dim_neighborhood.insert(
+        0, "neighborhood_sk", np.arange(1, len(dim_neighborhood) + 1, dtype="int32")
+    )
 
     # --- dim_host (SCD2-ready structure, single version for now) ---
     dim_host = (
@@ -106,7 +121,7 @@ def run_transform(
         .drop_duplicates(subset=["host_id"])
         .reset_index(drop=True)
     )
-    dim_host["host_sk"] = dim_host.index + 1
+    dim_host.insert(0, "host_sk", np.arange(1, len(dim_host) + 1, dtype="int32"))
     run_date = pd.Timestamp.today().normalize()
     dim_host["valid_from"] = run_date
     dim_host["valid_to"] = pd.NaT
@@ -117,6 +132,7 @@ def run_transform(
         dim_neighborhood,
         on=["neighbourhood_group", "neighbourhood"],
         how="left",
+        validate="m:1",
     )
 
     dim_listing = dim_listing[
@@ -135,97 +151,107 @@ def run_transform(
             "license",
             "latitude",
             "longitude",
-            "estimated_occupancy_rate",
-            "estimated_monthly_revenue",
-            "price_tier",
         ]
-    ].drop_duplicates(subset=["listing_id"]).reset_index(drop=True)
+    ].drop_duplicates(subset=["listing_id"])
+    # Sorted on the natural key so the id -> sk lookup index is monotonic
+    dim_listing = dim_listing.sort_values("listing_id").reset_index(drop=True)
 
-    dim_listing["listing_sk"] = dim_listing.index + 1
+    dim_listing.insert(
+        0, "listing_sk", np.arange(1, len(dim_listing) + 1, dtype="int32")
+    )
 
-    # --- fact_reviews ---
-    fact_reviews = reviews.merge(
-        dim_listing[["listing_id", "listing_sk", "host_id"]],
-        on="listing_id",
-        how="left",
+    return DWTables(
+        dim_date=dim_date,
+        dim_neighborhood=dim_neighborhood,
+        dim_host=dim_host,
+        dim_listing=dim_listing,
     )
 
-    fact_reviews = fact_reviews.merge(
-        dim_host[["host_id", "host_sk"]],
-        on="host_id",
-        how="left",
+
+def build_fact_reviews(
+    reviews: pd.DataFrame,
+    dim_listing: pd.DataFrame,
+    dim_host: pd.DataFrame,
+    dim_date: pd.DataFrame,
+) -> pd.DataFrame:
+    """
+    Resolve reviews to fact_reviews rows. Works on the full frame or on a
+    chunk; reviews with an unknown listing or a date outside dim_date are
+    dropped.
+    """
+    fact_cols = ["listing_sk", "host_sk", "date_sk", "review_count"]
+    if dim_listing.empty or dim_date.empty:
+        return pd.DataFrame({c: np.array([], dtype="int32") for c in fact_cols})
+    if not dim_listing["listing_id"].is_monotonic_increasing:
+        dim_listing = dim_listing.sort_values("listing_id")
+
+    # Per-listing keys, aligned with dim_listing rows. host_sk is resolved
+    # here once per listing (0 = unknown host) rather than once per review.
+    dim_listing_ids = dim_listing["listing_id"].to_numpy(dtype="int64")
+    listing_sks = dim_listing["listing_sk"].to_numpy(dtype="int32")
+    host_sk_map = pd.Series(
+        dim_host["host_sk"].values, index=dim_host["host_id"].values
+    )
+    host_sks = (
+        dim_listing["host_id"].map(host_sk_map).fillna(0).to_numpy(dtype="int32")
     )
 
-    fact_reviews = fact_reviews.merge(
-        dim_date[["date_sk", "full_date"]],
-        left_on="date",
-        right_on="full_date",
-        how="left",
+    # One binary-search pass over the sorted listing ids gives the dim_listing
+    # row for every review; listing_sk and host_sk are then plain gathers.
+    listing_ids = reviews["listing_id"].to_numpy(dtype="int64")
+    pos = np.searchsorted(dim_listing_ids, listing_ids)
+    pos = np.minimum(pos, len(dim_listing_ids) - 1)
+    found = (dim_listing_ids[pos] == listing_ids) & (host_sks[pos] > 0)
+
+    # date_sk is the day offset into the contiguous dim_date calendar
+    review_days = reviews["date"].to_numpy(dtype="datetime64[D]")
+    first_day = np.datetime64(dim_date["full_date"].iloc[0], "D")
+    date_sks = (review_days - first_day).astype("int64") + 1
+    in_calendar = (
+        ~np.isnat(review_days) & (date_sks >= 1) & (date_sks <= len(dim_date))
+    )
+
+    keep = found & in_calendar
+    pos = pos[keep]
+
+    return pd.DataFrame(
+        {
+            "listing_sk": listing_sks[pos],
+            "host_sk": host_sks[pos],
+            "date_sk": date_sks[keep].astype("int32"),
+            "review_count": np.ones(len(pos), dtype="int32"),
+        },
+        columns=fact_cols,
     )
 
-    fact_reviews["review_count"] = 1
-
-    fact_reviews = fact_reviews[
-        ["listing_sk", "host_sk", "date_sk", "review_count"]
-    ].dropna(subset=["listing_sk", "host_sk", "date_sk"])
-
-    # --- Build dicts to pass to load ---
-    dims = {
-        "dim_date": dim_date[
-            [
-                "date_sk",
-                "full_date",
-                "year",
-                "month",
-                "day",
-                "month_name",
-                "day_of_week",
-                "day_name",
-            ]
-        ],
-        "dim_neighborhood": dim_neighborhood[
-            ["neighborhood_sk", "neighbourhood_group", "neighbourhood"]
-        ],
-        "dim_host": dim_host[
-            [
-                "host_sk",
-                "host_id",
-                "host_name",
-                "calculated_host_listings_count",
-                "valid_from",
-                "valid_to",
-                "is_current",
-            ]
-        ],
-        "dim_listing": dim_listing[
-            [
-                "listing_sk",
-                "listing_id",
-                "name",
-                "host_id",
-                "neighborhood_sk",
-                "room_type",
-                "price",
-                "minimum_nights",
-                "availability_365",
-                "number_of_reviews",
-                "reviews_per_month",
-                "number_of_reviews_ltm",
-                "license",
-                "latitude",
-                "longitude",
-                # "estimated_occupancy_rate",
-                # "estimated_monthly_revenue",
-                # "price_tier",
-            ]
-        ],
-    }
-
-    facts = {
-        "fact_reviews": fact_reviews
-    }
+
+def run_transform(
+    listings: pd.DataFrame,
+    reviews: pd.DataFrame,
+) -> DWTables:
+    """
+    Transform step:
+    - Clean fields
+    - Build star-schema tables as DataFrames:
+      dim_date, dim_neighborhood, dim_host (SCD2-ready), dim_listing, fact_reviews
+    - Return them together as a DWTables
+    """
+    logger.info("Starting transform step")
+
+    # Extract already parses dates; only coerce (into a new frame) if it didn't
+    if not pd.api.types.is_datetime64_any_dtype(reviews["date"]):
+        reviews = reviews.assign(
+            date=pd.to_datetime(reviews["date"], errors="coerce")
+        )
+
+    tables = build_dims(listings, reviews["date"].min(), reviews["date"].max())
+    tables.fact_reviews = build_fact_reviews(
+        reviews, tables.dim_listing, tables.dim_host, tables.dim_date
+    )
 
     logger.info(
-        f"Transform complete. dim_listing={len(dim_listing)}, fact_reviews={len(fact_reviews)}"
+        "Transform complete. dim_listing=%d, fact_reviews=%d",
+        len(tables.dim_listing),
+        len(tables.fact_reviews),
     )
-    return dims, facts
+    return tables
@@ -1,14 +1,33 @@
 # src/pipeline/validate.py
 import json
+from dataclasses import dataclass
 from pathlib import Path
-import yaml
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from src.pipeline.extract import LISTINGS_COLUMNS, REVIEWS_COLUMNS
+from src.utils.config import load_config
 from src.utils.logger import get_logger
 
 
 logger = get_logger(__name__)
 
 
+@dataclass
+class StreamedReviewStats:
+    """
+    Review check counts gathered chunk by chunk while reviews are streamed to
+    the fact table; record_streamed_review_checks adds them to the report.
+    """
+
+    columns: list
+    row_count: int = 0
+    null_listing_ids: int = 0
+    orphan_reviews: int = 0
+    loaded: int = 0
+
+
 def _check_columns_present(df: pd.DataFrame, required_cols, check_name, checks):
     missing = [c for c in required_cols if c not in df.columns]
     status = "pass" if not missing else "fail"
@@ -20,7 +39,7 @@ def _check_columns_present(df: pd.DataFrame, required_cols, check_name, checks):
         }
     )
     if missing:
-        logger.warning(f"{check_name} failed. Missing columns: {missing}")
+        logger.warning("%s failed. Missing columns: %s", check_name, missing)
 
 
 def _check_not_null(df, column, check_name, checks):
@@ -34,7 +53,7 @@ def _check_not_null(df, column, check_name, checks):
         }
     )
     if null_count > 0:
-        logger.warning(f"{check_name} failed. Nulls in {column}: {null_count}")
+        logger.warning("%s failed. Nulls in %s: %d", check_name, column, null_count)
 
 
 def _check_unique(df, column, check_name, checks):
@@ -48,12 +67,14 @@ def _check_unique(df, column, check_name, checks):
         }
     )
     if dup_count > 0:
-        logger.warning(f"{check_name} failed. Duplicates in {column}: {dup_count}")
+        logger.warning(
+            "%s failed. Duplicates in %s: %d", check_name, column, dup_count
+        )
 
 
 def run_validate(
     listings: pd.DataFrame,
-    reviews: pd.DataFrame,
+    reviews: pd.DataFrame | None,
     config_path: str = "src/config/config.yaml",
 ):
     """
@@ -64,9 +85,13 @@ def run_validate(
     - FK checks (reviews.listing_id in listings.id)
     - Write data_quality_report.json
     - Return cleaned DataFrames with bad rows removed where possible
+
+    reviews may be None when reviews are streamed in chunks; only listings
+    are checked then. Orphan reviews are dropped chunk by chunk at load, and
+    record_streamed_review_checks adds the review checks to the report.
+    The caller's frames are not modified.
     """
-    with open(config_path) as f:
-        config = yaml.safe_load(f)
+    config = load_config(config_path)
 
     validation_cfg = config.get("validation", {})
     report_path = Path(config["output"]["data_quality_report"])
@@ -75,46 +100,28 @@ def run_validate(
     checks = []
 
     # --- Expected columns ---
-    listings_required = [
-        "id",
-        "name",
-        "host_id",
-        "host_name",
-        "neighbourhood_group",
-        "neighbourhood",
-        "latitude",
-        "longitude",
-        "room_type",
-        "price",
-        "minimum_nights",
-        "number_of_reviews",
-        "last_review",
-        "reviews_per_month",
-        "calculated_host_listings_count",
-        "availability_365",
-        "number_of_reviews_ltm",
-        "license",
-    ]
-    reviews_required = ["listing_id", "date"]
+    listings_required = list(LISTINGS_COLUMNS)
+    reviews_required = list(REVIEWS_COLUMNS)
 
     _check_columns_present(
         listings, listings_required, "listings_columns_present", checks
     )
-    _check_columns_present(
-        reviews, reviews_required, "reviews_columns_present", checks
-    )
-
-    # Only keep the expected columns (drop unexpected extras)
-    listings = listings[listings_required].copy()
-    reviews = reviews[reviews_required].copy()
+    if reviews is not None:
+        _check_columns_present(
+            reviews, reviews_required, "reviews_columns_present", checks
+        )
 
     # --- Null checks ---
     _check_not_null(listings, "id", "listings_id_not_null", checks)
-    _check_not_null(reviews, "listing_id", "reviews_listing_id_not_null", checks)
+    if reviews is not None:
+        _check_not_null(
+            reviews, "listing_id", "reviews_listing_id_not_null", checks
+        )
 
     # Drop rows with null IDs
     listings = listings[~listings["id"].isna()].copy()
-    reviews = reviews[~reviews["listing_id"].isna()].copy()
+    if reviews is not None:
+        reviews = reviews[~reviews["listing_id"].isna()].copy()
 
     # --- Uniqueness checks ---
     _check_unique(listings, "id", "listings_id_unique", checks)
@@ -125,16 +132,15 @@ def run_validate(
     after = len(listings)
     if before != after:
         logger.warning(
-            f"Deduplicated listings on id. Before={before}, After={after}"
+            "Deduplicated listings on id. Before=%d, After=%d", before, after
         )
 
     # --- Value range checks ---
-    # Convert some fields to numeric
-    listings["availability_365"] = pd.to_numeric(
-        listings["availability_365"], errors="coerce"
-    )
-    listings["latitude"] = pd.to_numeric(listings["latitude"], errors="coerce")
-    listings["longitude"] = pd.to_numeric(listings["longitude"], errors="coerce")
+    # Extract already reads these as numbers; only coerce columns that arrive
+    # as strings, and only after null ids and duplicates have been dropped
+    for col in ("availability_365", "latitude", "longitude"):
+        if not pd.api.types.is_numeric_dtype(listings[col]):
+            listings[col] = pd.to_numeric(listings[col], errors="coerce")
 
     min_price = validation_cfg.get("min_price", 1)
     max_avail = validation_cfg.get("max_availability", 365)
@@ -153,72 +159,140 @@ def run_validate(
         }
     )
 
-    # Latitude/Longitude range
-    invalid_lat = ~listings["latitude"].between(min_lat, max_lat)
-    invalid_lon = ~listings["longitude"].between(min_lon, max_lon)
+    # Latitude/Longitude range (masks as ndarrays; counts computed once)
+    invalid_lat = ~listings["latitude"].between(min_lat, max_lat).to_numpy()
+    invalid_lon = ~listings["longitude"].between(min_lon, max_lon).to_numpy()
+    invalid_lat_count = int(invalid_lat.sum())
+    invalid_lon_count = int(invalid_lon.sum())
 
     checks.append(
         {
             "name": "latitude_in_range",
-            "status": "pass" if invalid_lat.sum() == 0 else "fail",
-            "invalid_count": int(invalid_lat.sum()),
+            "status": "pass" if invalid_lat_count == 0 else "fail",
+            "invalid_count": invalid_lat_count,
         }
     )
     checks.append(
         {
             "name": "longitude_in_range",
-            "status": "pass" if invalid_lon.sum() == 0 else "fail",
-            "invalid_count": int(invalid_lon.sum()),
+            "status": "pass" if invalid_lon_count == 0 else "fail",
+            "invalid_count": invalid_lon_count,
         }
     )
 
     # Drop rows with invalid lat/lon
-    bad_geo = invalid_lat | invalid_lon
-    if bad_geo.sum() > 0:
-        logger.warning(f"Dropping {int(bad_geo.sum())} listings with bad lat/lon")
-        listings = listings[~bad_geo].copy()
+    bad_geo = np.logical_or(invalid_lat, invalid_lon)
+    bad_geo_count = int(bad_geo.sum())
+    if bad_geo_count > 0:
+        logger.warning("Dropping %d listings with bad lat/lon", bad_geo_count)
+        listings = listings.iloc[~bad_geo]
 
     # Availability range
-    invalid_avail = ~listings["availability_365"].between(0, max_avail)
+    invalid_avail = ~listings["availability_365"].between(0, max_avail).to_numpy()
+    invalid_avail_count = int(invalid_avail.sum())
     checks.append(
         {
             "name": "availability_in_range",
-            "status": "pass" if invalid_avail.sum() == 0 else "fail",
-            "invalid_count": int(invalid_avail.sum()),
+            "status": "pass" if invalid_avail_count == 0 else "fail",
+            "invalid_count": invalid_avail_count,
         }
     )
-    if invalid_avail.sum() > 0:
+    if invalid_avail_count > 0:
         logger.warning(
-            f"Dropping {int(invalid_avail.sum())} listings with invalid availability"
+            "Dropping %d listings with invalid availability", invalid_avail_count
         )
-        listings = listings[~invalid_avail].copy()
+        listings = listings.iloc[~invalid_avail]
 
     # --- FK check: reviews listing_id exists in listings.id ---
-    valid_listing_ids = set(listings["id"].unique())
-    fk_valid_mask = reviews["listing_id"].isin(valid_listing_ids)
-    fk_invalid_count = (~fk_valid_mask).sum()
-    checks.append(
-        {
-            "name": "reviews_listing_id_fk",
-            "status": "pass" if fk_invalid_count == 0 else "fail",
-            "orphan_reviews": int(fk_invalid_count),
-        }
-    )
-    if fk_invalid_count > 0:
-        logger.warning(
-            f"Dropping {int(fk_invalid_count)} reviews with unknown listing_id"
+    if reviews is not None:
+        # Arrow hashes the int64 id buffer natively; no Python set of ids is built
+        fk_valid_mask = pc.is_in(
+            pa.array(reviews["listing_id"]),
+            value_set=pa.array(listings["id"].unique()),
+        ).to_numpy(zero_copy_only=False)
+        fk_invalid_count = int(len(fk_valid_mask) - fk_valid_mask.sum())
+        checks.append(
+            {
+                "name": "reviews_listing_id_fk",
+                "status": "pass" if fk_invalid_count == 0 else "fail",
+                "orphan_reviews": fk_invalid_count,
+            }
         )
-        reviews = reviews[fk_valid_mask].copy()
+        if fk_invalid_count > 0:
+            logger.warning(
+                "Dropping %d reviews with unknown listing_id", fk_invalid_count
+            )
+            reviews = reviews.iloc[fk_valid_mask]
 
     # --- Summarise report ---
     report = {
         "listings_row_count_after_validation": int(len(listings)),
-        "reviews_row_count_after_validation": int(len(reviews)),
+        "reviews_row_count_after_validation": (
+            int(len(reviews)) if reviews is not None else None
+        ),
         "checks": checks,
     }
 
     with open(report_path, "w") as f:
         json.dump(report, f, indent=2)
 
-    logger.info(f"Data quality report written to {report_path}")
+    logger.info("Data quality report written to %s", report_path)
     return listings, reviews
+
+
+def record_streamed_review_checks(
+    stats: StreamedReviewStats,
+    config_path: str = "src/config/config.yaml",
+):
+    """
+    Add the review checks of a streamed load to the data quality report
+    written by run_validate(listings, None), using the same check names and
+    fields as the whole-frame path.
+    """
+    config = load_config(config_path)
+    report_path = Path(config["output"]["data_quality_report"])
+    with open(report_path) as f:
+        report = json.load(f)
+
+    checks = report["checks"]
+    missing = [c for c in REVIEWS_COLUMNS if c not in stats.columns]
+    checks.append(
+        {
+            "name": "reviews_columns_present",
+            "status": "pass" if not missing else "fail",
+            "missing_columns": missing,
+        }
+    )
+    checks.append(
+        {
+            "name": "reviews_listing_id_not_null",
+            "status": "pass" if stats.null_listing_ids == 0 else "fail",
+            "null_count": stats.null_listing_ids,
+        }
+    )
+    checks.append(
+        {
+            "name": "reviews_listing_id_fk",
+            "status": "pass" if stats.orphan_reviews == 0 else "fail",
+            "orphan_reviews": stats.orphan_reviews,
+        }
+    )
+    if stats.null_listing_ids > 0:
+        logger.warning(
+            "reviews_listing_id_not_null failed. Nulls in listing_id: %d",
+            stats.null_listing_ids,
+        )
+    if stats.orphan_reviews > 0:
+        logger.warning(
+            "Dropped %d streamed reviews with unknown listing_id",
+            stats.orphan_reviews,
+        )
+
+    report["reviews_row_count_after_validation"] = (
+        stats.row_count - stats.null_listing_ids - stats.orphan_reviews
+    )
+
+    with open(report_path, "w") as f:
+        json.dump(report, f, indent=2)
+
+    logger.info("Streamed review checks added to %s", report_path)
@@ -0,0 +1,18 @@
+# src/utils/config.py
+from functools import lru_cache
+import yaml
+
+try:
+    _Loader = yaml.CSafeLoader  # libyaml-backed, much faster when available
+except AttributeError:
+    _Loader = yaml.SafeLoader
+
+
+@lru_cache(maxsize=4)
+def load_config(path: str) -> dict:
+    """
+    Parse the YAML config at `path` once per process.
+    The returned dict is shared between callers and must not be mutated.
+    """
+    with open(path) as f:
+        return yaml.load(f, Loader=_Loader)
@@ -1,10 +1,13 @@
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
 from sqlalchemy import create_engine
 
 load_dotenv()
 
+@lru_cache(maxsize=1)
 def get_engine():
+    """Build the warehouse engine once; later calls reuse it and its pool."""
     db = os.getenv("DB_NAME")
     user = os.getenv("DB_USER")
     pwd = os.getenv("DB_PASSWORD")
@@ -13,5 +16,4 @@ def get_engine():
 
     url = f"postgresql+psycopg2://{user}:{pwd}@{host}:{port}/{db}"
     engine = create_engine(url)
-    print("Connection successfull")
     return engine
@@ -1,15 +1,16 @@
 # src/utils/logger.py
 import logging
+from functools import lru_cache
 from pathlib import Path
-import yaml
+from src.utils.config import load_config
 
 DEFAULT_LOG_PATH = Path("logs/pipeline_execution.log")
 
 
+@lru_cache(maxsize=4)
 def _load_log_path_from_config(config_path: str) -> Path:
     try:
-        with open(config_path) as f:
-            config = yaml.safe_load(f)
+        config = load_config(config_path)
         log_path = config.get("output", {}).get("log_file")
         if log_path:
             return Path(log_path)
@@ -19,11 +20,12 @@ def _load_log_path_from_config(config_path: str) -> Path:
 
 
 def get_logger(name: str, config_path: str = "src/config/config.yaml") -> logging.Logger:
-    log_path = _load_log_path_from_config(config_path)
-    log_path.parent.mkdir(parents=True, exist_ok=True)
-
     logger = logging.getLogger(name)
     if not logger.handlers:
+        # Only a logger's first call needs the log path and directory
+        log_path = _load_log_path_from_config(config_path)
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+
         logger.setLevel(logging.INFO)
 
         fh = logging.FileHandler(log_path)
@@ -6,11 +6,21 @@ Shared pytest configuration and fixtures.
 - Provides fixtures for raw data, validated data, transformed data, and a DB engine.
 """
 
+import copy
 import os
 import sys
 import pathlib
+from operator import itemgetter
+from types import MappingProxyType, SimpleNamespace
 
+import pandas as pd
 import pytest
+import yaml
+
+try:
+    from orjson import loads as _json_loads  # optional, faster JSON parser
+except ImportError:
+    from json import loads as _json_loads
 
 # --- Make src importable: add project root to sys.path ---
 PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
@@ -27,3 +37,66 @@ def project_root() -> pathlib.Path:
 def config_path(project_root) -> str:
     """Return the default config path used by the pipeline."""
     return str(project_root / "src" / "config" / "config.yaml")
+
+
+@pytest.fixture(scope="session")
+def cfg(config_path) -> MappingProxyType:
+    """Parsed pipeline config (cached by load_config), read-only."""
+    from src.utils.config import load_config
+
+    return MappingProxyType(load_config(config_path))
+
+
+@pytest.fixture
+def make_config(cfg, tmp_path):
+    """
+    Write a copy of the pipeline config into tmp_path, with the given sections
+    updated (e.g. data_paths={"reviews": ...}), and return its path.
+    The data quality report is redirected to tmp_path.
+    """
+
+    def _make(**sections) -> str:
+        config = copy.deepcopy(dict(cfg))
+        sections.setdefault("output", {})
+        sections["output"].setdefault(
+            "data_quality_report", str(tmp_path / "data_quality_report.json")
+        )
+        for section, values in sections.items():
+            config[section] = {**config.get(section, {}), **values}
+        path = tmp_path / "config.yaml"
+        path.write_text(yaml.safe_dump(config))
+        return str(path)
+
+    return _make
+
+
+@pytest.fixture(scope="session")
+def validated_bundle(config_path, cfg) -> SimpleNamespace:
+    """
+    Run extract + validate once per session and share the results.
+    Tests must treat these frames as read-only.
+    """
+    from src.pipeline.extract import run_extract
+    from src.pipeline.validate import run_validate
+
+    listings_raw, reviews_raw = run_extract(config_path=config_path)
+    listings_v, reviews_v = run_validate(
+        listings_raw, reviews_raw, config_path=config_path
+    )
+
+    report_path = pathlib.Path(cfg["output"]["data_quality_report"])
+    report = _json_loads(report_path.read_bytes())
+
+    # Built once so membership tests probe an existing hashtable
+    valid_ids_index = pd.Index(listings_v["id"].to_numpy(copy=False))
+
+    return SimpleNamespace(
+        listings_raw=listings_raw,
+        reviews_raw=reviews_raw,
+        listings_v=listings_v,
+        reviews_v=reviews_v,
+        valid_ids_index=valid_ids_index,
+        listings_has_nulls=bool(listings_v["id"].isna().any()),
+        report=report,
+        check_names=frozenset(map(itemgetter("name"), report["checks"])),
+    )
@@ -9,7 +9,7 @@ Focus:
 
 import pandas as pd
 
-from src.pipeline.extract import run_extract
+from src.pipeline.extract import run_extract, scan_review_dates
 
 
 def test_extract_returns_dataframes(config_path):
@@ -58,3 +58,42 @@ def test_extract_expected_columns_reviews(config_path):
     expected_cols = {"listing_id", "date"}
     missing = expected_cols - set(reviews.columns)
     assert not missing, f"Reviews missing expected columns: {missing}"
+
+
+def test_extract_reviews_in_chunks(config_path, validated_bundle):
+    """With reviews_chunksize, reviews arrive as bounded chunks covering every row."""
+    reviews = validated_bundle.reviews_raw
+    _, reviews_iter = run_extract(config_path=config_path, reviews_chunksize=10_000)
+
+    chunk_sizes = [len(chunk) for chunk in reviews_iter]
+
+    assert max(chunk_sizes) <= 10_000
+    assert sum(chunk_sizes) == len(reviews)
+
+
+def test_scan_review_dates_matches_full_read(config_path, validated_bundle):
+    """The chunked date scan should find the span of the validated reviews."""
+    reviews_v = validated_bundle.reviews_v
+
+    first, last = scan_review_dates(
+        config_path, chunksize=10_000, listing_ids=validated_bundle.listings_v["id"]
+    )
+
+    assert first == reviews_v["date"].min()
+    assert last == reviews_v["date"].max()
+
+
+def test_extract_keeps_large_review_ids_exact_with_nulls(make_config, tmp_path):
+    """A null listing_id must not round the other 64-bit ids through float64."""
+    big_id = 1507276928362597476
+    reviews_path = tmp_path / "reviews.csv"
+    reviews_path.write_text(f"listing_id,date\n{big_id},2024-01-01\n,2024-01-02\n")
+    config_path = make_config(data_paths={"reviews": str(reviews_path)})
+
+    _, reviews = run_extract(config_path=config_path)
+    _, reviews_iter = run_extract(config_path=config_path, reviews_chunksize=10)
+    streamed = pd.concat(reviews_iter, ignore_index=True)
+
+    for frame in (reviews, streamed):
+        assert int(frame["listing_id"].iloc[0]) == big_id
+        assert frame["listing_id"].isna().sum() == 1
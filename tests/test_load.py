@@ -11,14 +11,24 @@ These tests require:
 Focus:
 - run_load completes without error
 - Dimension and fact tables in Postgres are populated
+- Streamed fact_reviews match the whole-frame build
+  (the stream_reviews_to_facts test runs on in-memory SQLite, no Postgres)
 """
 
-from sqlalchemy import text
+import json
+import sqlite3
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import create_engine, text
 
 from src.pipeline.extract import run_extract
 from src.pipeline.validate import run_validate
 from src.pipeline.transform import run_transform
-from src.pipeline.load import run_load
+from src.pipeline.load import _insert_df, run_load, stream_reviews_to_facts
+from src.pipeline.orchestrator import _run_streaming
+from src.utils.config import load_config
 from src.utils.db_connector import get_engine
 
 
@@ -31,12 +41,12 @@ def test_load_populates_database(config_path):
     """
     listings_raw, reviews_raw = run_extract(config_path=config_path)
     listings_v, reviews_v = run_validate(
-        listings_raw.copy(), reviews_raw.copy(), config_path=config_path
+        listings_raw, reviews_raw, config_path=config_path
     )
-    dims, facts = run_transform(listings_v, reviews_v)
+    tables = run_transform(listings_v, reviews_v)
 
     # Execute load (will truncate + reload)
-    run_load(dims, facts, config_path=config_path)
+    run_load(tables, config_path=config_path)
 
     # Now query DB to check row counts
     engine = get_engine()
@@ -60,3 +70,111 @@ def test_load_populates_database(config_path):
     assert row.dim_host_rows > 0, "dim_host is empty after load"
     assert row.dim_listing_rows > 0, "dim_listing is empty after load"
     assert row.fact_reviews_rows > 0, "fact_reviews is empty after load"
+
+
+def test_insert_fallback_respects_sqlite_variable_limit():
+    """The to_sql fallback must batch under SQLite's default bind-parameter cap."""
+    n_rows = 20_000
+    facts = pd.DataFrame(
+        {
+            col: np.arange(n_rows, dtype="int32")
+            for col in ["listing_sk", "host_sk", "date_sk", "review_count"]
+        }
+    )
+
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        # Stock SQLite builds default to 32766; some distros raise it
+        conn.connection.driver_connection.setlimit(
+            sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 32_766
+        )
+        _insert_df(conn, "fact_reviews", facts)
+        loaded = conn.execute(text("SELECT COUNT(*) FROM fact_reviews")).scalar()
+
+    assert loaded == n_rows
+
+
+def test_stream_reviews_to_facts_matches_full(config_path, validated_bundle):
+    """Streaming reviews chunk by chunk should load the same facts as transform."""
+    tables = run_transform(validated_bundle.listings_v, validated_bundle.reviews_v)
+
+    # Raw chunks, as the chunked extract yields them (orphans included)
+    _, reviews_iter = run_extract(config_path=config_path, reviews_chunksize=10_000)
+
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        stats = stream_reviews_to_facts(
+            tables.dim_listing,
+            tables.dim_host,
+            tables.dim_date,
+            reviews_iter,
+            conn,
+        )
+        streamed = pd.read_sql_table("fact_reviews", conn)
+
+    fact_cols = ["listing_sk", "host_sk", "date_sk", "review_count"]
+    expected = tables.fact_reviews.sort_values(fact_cols).reset_index(drop=True)
+    streamed = streamed.sort_values(fact_cols).reset_index(drop=True)
+
+    assert stats.loaded == len(tables.fact_reviews)
+    pd.testing.assert_frame_equal(streamed, expected, check_dtype=False)
+
+
+def test_streaming_pipeline_matches_full_load(cfg, make_config, tmp_path):
+    """
+    The streaming pipeline should load the same tables and report the same
+    review checks as the full one, even when reviews.csv holds a null-id
+    review and an orphan review dated far outside the real span.
+    """
+    reviews_path = tmp_path / "reviews.csv"
+    with open(cfg["data_paths"]["reviews"]) as src, open(reviews_path, "w") as dst:
+        dst.write(src.read().rstrip("\n") + "\n")
+        dst.write(",2020-01-01\n")
+        dst.write("999999999999,1990-01-01\n")
+    config_path = make_config(data_paths={"reviews": str(reviews_path)})
+
+    counts_sql = text(
+        """
+        SELECT
+          (SELECT COUNT(*) FROM dim_date)          AS dim_date_rows,
+          (SELECT COUNT(*) FROM dim_listing)       AS dim_listing_rows,
+          (SELECT COUNT(*) FROM fact_reviews)      AS fact_reviews_rows,
+          (SELECT COALESCE(SUM(listing_sk + host_sk + date_sk), 0)
+             FROM fact_reviews)                    AS fact_key_sum
+        """
+    )
+
+    listings_raw, reviews_raw = run_extract(config_path=config_path)
+    listings_v, reviews_v = run_validate(
+        listings_raw, reviews_raw, config_path=config_path
+    )
+    run_load(run_transform(listings_v, reviews_v), config_path=config_path)
+
+    report_path = Path(load_config(config_path)["output"]["data_quality_report"])
+
+    engine = get_engine()
+    with engine.connect() as conn:
+        full = conn.execute(counts_sql).fetchone()
+    full_report = json.loads(report_path.read_text())
+
+    _run_streaming(config_path, reviews_chunksize=10_000)
+
+    with engine.connect() as conn:
+        streamed = conn.execute(counts_sql).fetchone()
+    streamed_report = json.loads(report_path.read_text())
+
+    assert tuple(streamed) == tuple(full)
+
+    # Same review checks and counts, whatever order they were recorded in
+    def review_checks(report):
+        return {
+            c["name"]: c for c in report["checks"] if c["name"].startswith("reviews_")
+        }
+
+    assert review_checks(streamed_report) == review_checks(full_report)
+    assert review_checks(streamed_report)["reviews_listing_id_fk"]["orphan_reviews"] == 1
+    assert review_checks(streamed_report)["reviews_listing_id_not_null"]["null_count"] == 1
+    assert (
+        streamed_report["reviews_row_count_after_validation"]
+        == full_report["reviews_row_count_after_validation"]
+    )
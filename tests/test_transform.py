@@ -9,37 +9,123 @@ Focus:
 """
 
 import numpy as np
+import pandas as pd
+import pytest
 
 from src.pipeline.extract import run_extract
 from src.pipeline.validate import run_validate
-from src.pipeline.transform import run_transform
+from src.pipeline.transform import (
+    build_dim_date,
+    build_dims,
+    build_fact_reviews,
+    clean_price,
+    run_transform,
+)
 
 
 def _run_full_transform(config_path):
     """Helper: extract → validate → transform."""
     listings_raw, reviews_raw = run_extract(config_path=config_path)
     listings_v, reviews_v = run_validate(
-        listings_raw.copy(), reviews_raw.copy(), config_path=config_path
+        listings_raw, reviews_raw, config_path=config_path
     )
-    dims, facts = run_transform(listings_v, reviews_v)
-    return dims, facts
+    return run_transform(listings_v, reviews_v)
 
 
 def test_transform_outputs_exist(config_path):
     """Transform should return all four dims and fact_reviews."""
-    dims, facts = _run_full_transform(config_path)
+    tables = _run_full_transform(config_path)
 
     for key in ["dim_date", "dim_neighborhood", "dim_host", "dim_listing"]:
-        assert key in dims, f"{key} not returned from transform"
-        assert not dims[key].empty, f"{key} is empty"
+        dim = getattr(tables, key)
+        assert dim is not None, f"{key} not returned from transform"
+        assert not dim.empty, f"{key} is empty"
+
+    assert tables.fact_reviews is not None, "fact_reviews not returned from transform"
+    assert not tables.fact_reviews.empty, "fact_reviews is empty"
+
+
+def test_transform_fact_reviews_chunked_matches_full(validated_bundle):
+    """Building fact_reviews chunk by chunk should match the whole-frame build."""
+    reviews_v = validated_bundle.reviews_v
+    tables = run_transform(validated_bundle.listings_v, reviews_v)
+
+    chunks = [
+        build_fact_reviews(
+            reviews_v.iloc[start:start + 10_000],
+            tables.dim_listing,
+            tables.dim_host,
+            tables.dim_date,
+        )
+        for start in range(0, len(reviews_v), 10_000)
+    ]
+    chunked = pd.concat(chunks, ignore_index=True)
+
+    pd.testing.assert_frame_equal(
+        chunked, tables.fact_reviews.reset_index(drop=True)
+    )
+
+
+def test_clean_price_strips_currency_text():
+    """Text prices lose "$" and "," separators; missing or unparseable become 0."""
+    raw = pd.Series(["$1,234.50", None, "abc"], dtype=object)
+
+    cleaned = clean_price(raw)
+
+    pd.testing.assert_series_equal(
+        cleaned, pd.Series([1234.5, 0.0, 0.0], dtype="float64")
+    )
+
+
+def test_transform_all_orphan_reviews(validated_bundle, make_config):
+    """If validation drops every review, transform yields empty dim_date and facts."""
+    orphans = validated_bundle.reviews_raw.assign(listing_id=-1)
+    listings_v, reviews_v = run_validate(
+        validated_bundle.listings_raw, orphans, config_path=make_config()
+    )
+    assert reviews_v.empty
+
+    tables = run_transform(listings_v, reviews_v)
+
+    # Empty, but with the same schema as a populated calendar
+    expected = build_dim_date(pd.Timestamp("2024-01-01"), pd.Timestamp("2024-01-02"))
+    assert tables.dim_date.empty
+    pd.testing.assert_series_equal(tables.dim_date.dtypes, expected.dtypes)
+    assert tables.fact_reviews.empty
+    assert not tables.dim_listing.empty
+
+
+def test_transform_host_listing_count_stays_integer(validated_bundle):
+    """A null host listing count must not turn the INT column into floats."""
+    reviews_v = validated_bundle.reviews_v
+    # astype returns a new frame, so the shared fixture frame is not modified
+    listings_v = validated_bundle.listings_v.astype({"calculated_host_listings_count": "float64"})
+    listings_v.loc[listings_v.index[0], "calculated_host_listings_count"] = np.nan
+
+    tables = build_dims(listings_v, reviews_v["date"].min(), reviews_v["date"].max())
+    counts = tables.dim_host["calculated_host_listings_count"]
+
+    assert counts.dtype == "Int64"
+    assert counts.isna().sum() == 1
+    assert "." not in counts.to_csv(index=False)
+
+
+@pytest.mark.parametrize("copy_on_write", [False, True])
+def test_transform_leaves_inputs_unchanged(validated_bundle, copy_on_write):
+    """run_transform/build_dims must not modify the caller's frames, with or without CoW."""
+    listings = validated_bundle.listings_v.copy()
+    reviews = validated_bundle.reviews_v.copy()
+
+    with pd.option_context("mode.copy_on_write", copy_on_write):
+        run_transform(listings, reviews)
 
-    assert "fact_reviews" in facts, "fact_reviews not returned from transform"
-    assert not facts["fact_reviews"].empty, "fact_reviews is empty"
+    pd.testing.assert_frame_equal(listings, validated_bundle.listings_v)
+    pd.testing.assert_frame_equal(reviews, validated_bundle.reviews_v)
 
 
 def test_transform_surrogate_keys_unique(config_path):
     """Surrogate keys in each dimension should be unique."""
-    dims, _ = _run_full_transform(config_path)
+    tables = _run_full_transform(config_path)
 
     for dim_name, key_col in [
         ("dim_date", "date_sk"),
@@ -47,19 +133,19 @@ def test_transform_surrogate_keys_unique(config_path):
         ("dim_host", "host_sk"),
         ("dim_listing", "listing_sk"),
     ]:
-        dim = dims[dim_name]
+        dim = getattr(tables, dim_name)
         duplicated = dim[key_col].duplicated().sum()
         assert duplicated == 0, f"{dim_name}.{key_col} contains duplicates"
 
 
 def test_transform_fact_fk_integrity(config_path):
     """Fact foreign keys should reference existing dim keys."""
-    dims, facts = _run_full_transform(config_path)
+    tables = _run_full_transform(config_path)
 
-    dim_listing = dims["dim_listing"]
-    dim_host = dims["dim_host"]
-    dim_date = dims["dim_date"]
-    fact_reviews = facts["fact_reviews"]
+    dim_listing = tables.dim_listing
+    dim_host = tables.dim_host
+    dim_date = tables.dim_date
+    fact_reviews = tables.fact_reviews
 
     listing_keys = set(dim_listing["listing_sk"].unique())
     host_keys = set(dim_host["host_sk"].unique())
@@ -81,10 +167,10 @@ def test_transform_basic_business_sanity(config_path):
     - price is positive for listings used in facts
     - review_count in fact_reviews is always 1
     """
-    dims, facts = _run_full_transform(config_path)
+    tables = _run_full_transform(config_path)
 
-    dim_listing = dims["dim_listing"]
-    fact_reviews = facts["fact_reviews"]
+    dim_listing = tables.dim_listing
+    fact_reviews = tables.fact_reviews
 
     # Join fact → listing for price
     merged = fact_reviews.merge(
@@ -7,70 +7,64 @@ Focus:
 - No orphan reviews (listing_id must exist in listings)
 - Latitude/longitude and availability ranges are respected
 - Data quality report is generated and contains check results
+- The caller's frames are not modified, with or without copy-on-write
+
+Extract + validate run once per session via the validated_bundle fixture.
 """
 
 import json
 from pathlib import Path
 
-from src.pipeline.extract import run_extract
+import numpy as np
+import pandas as pd
+import pytest
+
 from src.pipeline.validate import run_validate
+from src.utils.config import load_config
 
 
-def test_validate_basic_quality(config_path):
+def test_validate_basic_quality(validated_bundle):
     """After validation, IDs should be non-null and row counts reduced or equal."""
-    listings_raw, reviews_raw = run_extract(config_path=config_path)
-    listings_v, reviews_v = run_validate(
-        listings_raw.copy(), reviews_raw.copy(), config_path=config_path
-    )
+    listings_v = validated_bundle.listings_v
+    reviews_v = validated_bundle.reviews_v
 
     # IDs must be non-null
-    assert listings_v["id"].isna().sum() == 0, "Null ids still present in listings"
-    assert reviews_v["listing_id"].isna().sum() == 0, "Null listing_id still present in reviews"
+    assert not validated_bundle.listings_has_nulls, "Null ids still present in listings"
+    assert not reviews_v["listing_id"].isna().any(), "Null listing_id still present in reviews"
 
     # Should not increase row counts
-    assert len(listings_v) <= len(listings_raw)
-    assert len(reviews_v) <= len(reviews_raw)
+    assert len(listings_v) <= len(validated_bundle.listings_raw)
+    assert len(reviews_v) <= len(validated_bundle.reviews_raw)
 
 
-def test_validate_no_orphan_reviews(config_path):
+def test_validate_no_orphan_reviews(validated_bundle):
     """Every review.listing_id must exist in listings.id after validation."""
-    listings_raw, reviews_raw = run_extract(config_path=config_path)
-    listings_v, reviews_v = run_validate(
-        listings_raw.copy(), reviews_raw.copy(), config_path=config_path
-    )
+    reviews_v = validated_bundle.reviews_v
 
-    valid_listing_ids = set(listings_v["id"].unique())
-    invalid_mask = ~reviews_v["listing_id"].isin(valid_listing_ids)
-    invalid_count = int(invalid_mask.sum())
+    invalid_mask = ~reviews_v["listing_id"].isin(validated_bundle.valid_ids_index)
+    invalid_count = int(invalid_mask.to_numpy().sum())
 
     assert invalid_count == 0, f"Found {invalid_count} orphan reviews after validation"
 
 
-def test_validate_ranges_and_report(config_path, project_root):
+def test_validate_ranges_and_report(validated_bundle, cfg):
     """
     Validate should:
     - drop rows with invalid latitude/longitude or availability_365
     - create a JSON data quality report with checks
     """
-    _, _ = run_validate(*run_extract(config_path=config_path), config_path=config_path)
-
-    # Read config to find report path
-    from yaml import safe_load
-
-    with open(config_path) as f:
-        cfg = safe_load(f)
     report_path = Path(cfg["output"]["data_quality_report"])
 
     assert report_path.exists(), "data_quality_report.json was not created"
 
-    report = json.loads(report_path.read_text(encoding="utf-8"))
+    report = validated_bundle.report
 
     assert "checks" in report, "Report must contain a 'checks' list"
     assert isinstance(report["checks"], list)
     assert len(report["checks"]) > 0, "Expected at least one validation check recorded"
 
     # Make sure some range-related checks are present
-    check_names = {c["name"] for c in report["checks"]}
+    check_names = validated_bundle.check_names
     expected_some = {
         "latitude_in_range",
         "longitude_in_range",
@@ -80,3 +74,45 @@ def test_validate_ranges_and_report(config_path, project_root):
         "Expected latitude/longitude/availability range checks in report, "
         f"found only: {check_names}"
     )
+
+
+def test_validate_drops_out_of_range_rows(validated_bundle, make_config):
+    """Bad lat/lon (incl. NaN) and availability rows are dropped and counted."""
+    base_counts = {
+        c["name"]: c.get("invalid_count") for c in validated_bundle.report["checks"]
+    }
+    listings = validated_bundle.listings_raw.copy()
+    bad_lat, nan_lon, bad_lon, bad_avail = listings["id"].iloc[:4]
+    listings.loc[listings.index[0], "latitude"] = 95.0
+    listings.loc[listings.index[1], "longitude"] = np.nan
+    listings.loc[listings.index[2], "longitude"] = -200.0
+    listings.loc[listings.index[3], "availability_365"] = 400
+
+    config_path = make_config()
+    listings_v, _ = run_validate(
+        listings, validated_bundle.reviews_raw, config_path=config_path
+    )
+    report_path = Path(load_config(config_path)["output"]["data_quality_report"])
+    counts = {
+        c["name"]: c.get("invalid_count")
+        for c in json.loads(report_path.read_text())["checks"]
+    }
+
+    assert counts["latitude_in_range"] == base_counts["latitude_in_range"] + 1
+    assert counts["longitude_in_range"] == base_counts["longitude_in_range"] + 2
+    assert counts["availability_in_range"] == base_counts["availability_in_range"] + 1
+    assert not listings_v["id"].isin([bad_lat, nan_lon, bad_lon, bad_avail]).any()
+    assert len(listings_v) == len(validated_bundle.listings_v) - 4
+
+
+@pytest.mark.parametrize("copy_on_write", [False, True])
+def test_validate_leaves_inputs_unchanged(validated_bundle, make_config, copy_on_write):
+    """run_validate must not modify the caller's frames, with or without CoW."""
+    listings = validated_bundle.listings_raw.copy()
+    reviews = validated_bundle.reviews_raw.copy()
+
+    with pd.option_context("mode.copy_on_write", copy_on_write):
+        run_validate(listings, reviews, config_path=make_config())
+
+    pd.testing.assert_frame_equal(listings, validated_bundle.listings_raw)
+    pd.testing.assert_frame_equal(reviews, validated_bundle.reviews_raw)